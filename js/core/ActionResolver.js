@@ -75,6 +75,7 @@ function handleActionSubmit(actionType, player, target = null) {
     gameState.currentAction = { type: actionType, player: player, target: target, challenge: null, block: null };
 
     // Track history for AI analysis
+    player.prevAction = player.lastAction;
     player.lastAction = actionType;
 
     log(`${player.name} attempts to ${actionType}${target ? ' on ' + target.name : ''}.`);
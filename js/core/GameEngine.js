@@ -71,6 +71,7 @@ function startGame() {
     document.getElementById('lobby-screen').classList.remove('active');
     document.getElementById('game-screen').classList.add('active');
 
+    syncRenderToggle();
     updateUI();
     playTurn();
 }
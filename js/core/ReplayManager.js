@@ -63,12 +63,14 @@ function loadReplay(idx) {
     isReplayMode = true;
     activeReplayData = entry.replayData;
     currentReplayIndex = 0;
+    clearRenderOptOut();
 
     document.getElementById('history-screen').classList.remove('active');
     document.getElementById('game-screen').classList.add('active');
     document.getElementById('replay-controls').classList.remove('hidden');
     document.getElementById('quit-btn').classList.add('hidden');
     document.getElementById('exit-replay-btn').classList.remove('hidden');
+    document.getElementById('render-toggle-btn').classList.add('hidden');
     document.getElementById('action-panel').classList.add('hidden'); // Hide controls
 
     // Load first frame
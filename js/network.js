@@ -962,6 +962,7 @@ function startNetworkGame() {
         });
     });
 
+    syncRenderToggle();
     updateUI();
     playTurn();
 }
@@ -981,6 +982,7 @@ function setupClientGame(initialState) {
 
     // Load State
     syncClientState(initialState);
+    syncRenderToggle();
 }
 
 function serializeState() {
@@ -1047,7 +1049,22 @@ function syncClientState(remoteState) {
         gameState.currentAction = null;
     }
 
-    // Refresh Logs
+    // Refresh Logs (deferred to a single rebuild while nobody is watching)
+    if (isRenderSuspended()) {
+        renderState.logStale = true;
+    } else {
+        renderLogFromState();
+    }
+
+    updateUI();
+
+    // CAPTURE REPLAY (CLIENT)
+    if (!isReplayMode && isNetworkGame && !netState.isHost) {
+        captureReplaySnapshot();
+    }
+}
+
+function renderLogFromState() {
     const logBox = netUI.gameLog;
     logBox.innerHTML = '';
     gameState.log.forEach((msg, index) => {
@@ -1068,13 +1085,6 @@ function syncClientState(remoteState) {
         logBox.appendChild(div);
     });
     logBox.scrollTop = logBox.scrollHeight;
-
-    updateUI();
-
-    // CAPTURE REPLAY (CLIENT)
-    if (!isReplayMode && isNetworkGame && !netState.isHost) {
-        captureReplaySnapshot();
-    }
 }
 
 function broadcastState() {
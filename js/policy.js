@@ -0,0 +1,71 @@
+// --- OFFLINE-TRAINED POLICY TABLES ---
+// Compact Uint8 probability tables produced by tools/train_policy.py (one per difficulty).
+// Tables are fetched lazily the first time a bot of that difficulty is created; until a
+// table has loaded (or if it fails to load) bots fall back to their hand-tuned heuristics.
+
+const POLICY_KIND = { CHALLENGE: 0, BLOCK: 1, BLUFF: 2 };
+const POLICY_DIFFICULTIES = ['easy', 'normal', 'hard', 'hardcore'];
+const POLICY_TABLE_SIZE = 3 * 5 * 4 * 3 * 2 * 2 * 3 * 2;
+const POLICY_HEADER_SIZE = 8; // 'CPOL' + u8 version + u8 reserved + u16 LE entry count
+const POLICY_VERSION = 1;
+
+const policyTables = {
+    tables: {},   // difficulty -> Uint8Array
+    loading: {}   // difficulty -> Promise
+};
+
+function parsePolicyTable(buffer) {
+    if (!buffer || buffer.byteLength < POLICY_HEADER_SIZE) return null;
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+    if (magic !== 'CPOL' || view.getUint8(4) !== POLICY_VERSION) return null;
+
+    const count = view.getUint16(6, true);
+    if (count !== POLICY_TABLE_SIZE || buffer.byteLength < POLICY_HEADER_SIZE + count) return null;
+    return new Uint8Array(buffer, POLICY_HEADER_SIZE, count);
+}
+
+function loadPolicyTable(difficulty) {
+    if (!POLICY_DIFFICULTIES.includes(difficulty)) return Promise.resolve(null);
+    if (policyTables.tables[difficulty]) return Promise.resolve(policyTables.tables[difficulty]);
+    if (policyTables.loading[difficulty]) return policyTables.loading[difficulty];
+    if (typeof fetch !== 'function') return Promise.resolve(null);
+
+    policyTables.loading[difficulty] = fetch(`js/policy/${difficulty}.bin`)
+        .then(res => res.ok ? res.arrayBuffer() : null)
+        .then(buffer => {
+            const table = parsePolicyTable(buffer);
+            if (table) policyTables.tables[difficulty] = table;
+            else console.warn(`Policy table for ${difficulty} is missing or invalid; using heuristics.`);
+            return table;
+        })
+        .catch(e => {
+            console.warn(`Failed to load policy table for ${difficulty}:`, e);
+            return null;
+        });
+    return policyTables.loading[difficulty];
+}
+
+function hasPolicyTable(difficulty) {
+    return !!policyTables.tables[difficulty];
+}
+
+// Must match policy_index() in tools/train_policy.py
+function policyIndex(kind, role, revealed, held, myAlive, oppAlive, coins, repeat) {
+    let idx = kind;
+    idx = idx * 5 + ROLES.indexOf(role);
+    idx = idx * 4 + Math.min(revealed, 3);
+    idx = idx * 3 + Math.min(held, 2);
+    idx = idx * 2 + (myAlive >= 2 ? 1 : 0);
+    idx = idx * 2 + (oppAlive >= 2 ? 1 : 0);
+    idx = idx * 3 + (coins >= 7 ? 2 : (coins >= 3 ? 1 : 0));
+    idx = idx * 2 + (repeat ? 1 : 0);
+    return idx;
+}
+
+// Probability in [0, 1], or null if no table is loaded for this difficulty
+function lookupPolicy(difficulty, kind, role, revealed, held, myAlive, oppAlive, coins, repeat) {
+    const table = policyTables.tables[difficulty];
+    if (!table || !ROLES.includes(role)) return null;
+    return table[policyIndex(kind, role, revealed, held, myAlive, oppAlive, coins, repeat)] / 255;
+}
@@ -31,6 +31,10 @@ class Player {
         this.alive = true;
         this.memory = {};
         this.lastAction = null;
+        this.prevAction = null; // Action before lastAction (lastAction is set before reactions)
+
+        // Lazy-load the trained policy table for this difficulty (see js/policy.js)
+        if (isAI && typeof loadPolicyTable === 'function') loadPolicyTable(difficulty);
     }
 
     async loseCard(cardIndex) {
@@ -53,6 +57,32 @@ class Player {
         return this.cards.some(c => c && c.role === role && !c.dead);
     }
 
+    // TRAINED POLICY: Only used once the table for this difficulty has loaded
+    usesPolicy() {
+        return typeof hasPolicyTable === 'function' && hasPolicyTable(this.difficulty);
+    }
+
+    policyProbability(kind, role, opponent, repeat) {
+        let revealed = 0;
+        gameState.players.forEach(p => {
+            p.cards.forEach(c => { if (c && c.dead && c.role === role) revealed++; });
+        });
+        const held = this.cards.filter(c => c && c.role === role && !c.dead).length;
+        const myAlive = this.cards.filter(c => c && !c.dead).length;
+        const oppAlive = opponent ? opponent.cards.filter(c => c && !c.dead).length : 1;
+        return lookupPolicy(this.difficulty, kind, role, revealed, held, myAlive, oppAlive, this.coins, repeat);
+    }
+
+    // Bluff an action claim: learned probability if a table is loaded, else the hand-tuned threshold
+    wantsBluff(action, threshold) {
+        if (this.usesPolicy()) {
+            const opponent = getStrongestOpponent(this);
+            const p = this.policyProbability(POLICY_KIND.BLUFF, ACTIONS[action].role, opponent, this.lastAction === action);
+            return getSecureRandom() < p;
+        }
+        return getSecureRandom() > threshold;
+    }
+
     // AI LOGIC CORE
     async decideAction() {
         if (!this.alive) return;
@@ -152,15 +182,15 @@ class Player {
             if (this.coins >= 7) { this.doCoup(); return; }
 
             // Aggressive Assassination (High Bluff)
-            if (canAssassinate && (hasAssassin || getSecureRandom() > 0.3)) {
+            if (canAssassinate && (hasAssassin || this.wantsBluff('Assassinate', 0.3))) {
                 action = 'Assassinate';
             }
             // Tax often (Bluff Duke)
-            else if (hasDuke || getSecureRandom() > 0.4) {
+            else if (hasDuke || this.wantsBluff('Tax', 0.4)) {
                 action = 'Tax';
             }
             // Steal if Captain or desperate
-            else if (hasCaptain || getSecureRandom() > 0.5) {
+            else if (hasCaptain || this.wantsBluff('Steal', 0.5)) {
                 action = 'Steal';
             }
             else {
@@ -171,11 +201,11 @@ class Player {
             if (this.coins >= 7) {
                 this.doCoup();
                 return;
-            } else if (canAssassinate && (hasAssassin || getSecureRandom() > 0.4)) {
+            } else if (canAssassinate && (hasAssassin || this.wantsBluff('Assassinate', 0.4))) {
                 action = 'Assassinate'; // Real or bluff assassin
-            } else if (hasDuke || getSecureRandom() > 0.3) {
+            } else if (hasDuke || this.wantsBluff('Tax', 0.3)) {
                 action = 'Tax'; // Real or bluff tax
-            } else if (hasCaptain || getSecureRandom() > 0.5) {
+            } else if (hasCaptain || this.wantsBluff('Steal', 0.5)) {
                 action = 'Steal';
             } else {
                 action = 'Foreign Aid'; // Risky but fast
@@ -248,6 +278,12 @@ class Player {
             return false; // They are telling the truth. Never challenge.
         }
 
+        if (claimedRole && this.usesPolicy()) {
+            const repeated = actionObj.type !== 'Block' && bluffer.prevAction === actionObj.type;
+            const p = this.policyProbability(POLICY_KIND.CHALLENGE, claimedRole, bluffer, repeated);
+            return getSecureRandom() < p;
+        }
+
         if (claimedRole) {
             const myCopies = this.cards.filter(c => c && c.role === claimedRole && !c.dead).length;
 
@@ -311,7 +347,19 @@ class Player {
             return validCard.role;
         }
 
-        // Bluff block?
+        // Bluff block? (Trained policy: claim the blocker role with the best learned odds)
+        if (this.usesPolicy()) {
+            const actor = actionObj.player;
+            const repeated = actor.prevAction === actionObj.type;
+            let bestRole = null;
+            let bestP = -1;
+            blockerRoles.forEach(role => {
+                const p = this.policyProbability(POLICY_KIND.BLOCK, role, actor, repeated);
+                if (p > bestP) { bestP = p; bestRole = role; }
+            });
+            return getSecureRandom() < bestP ? bestRole : false;
+        }
+
         let shouldBluff = false;
 
         if (this.difficulty === 'broken') {
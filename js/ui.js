@@ -13,10 +13,97 @@ const reactionUI = {
     }
 };
 
+// --- RENDER SUSPENSION ---
+// When nobody is watching (background tab, or a watch-only player who hid the view),
+// skip DOM and animation work; audio cues are muted only by Hide View. Game state and
+// replay capture are untouched; a single catch-up render runs when the view is visible again.
+const renderState = {
+    optOut: false,        // Explicit "Hide View" toggle (spectators / AI-only games)
+    uiDeferred: false,    // updateUI() was requested while suspended
+    pendingLog: [],       // log() entries not yet written to the DOM
+    logStale: false       // Log box must be rebuilt from gameState.log (network clients)
+};
+
+function isRenderSuspended() {
+    if (renderState.optOut) return true;
+    return typeof document !== 'undefined' && document.hidden === true;
+}
+
+function isWatchOnly() {
+    if (isNetworkGame) return myPlayerId === -1;
+    return gameState.players.length > 0 && gameState.players.every(pl => pl.isAI);
+}
+
+function toggleRenderSuspend() {
+    renderState.optOut = !renderState.optOut;
+
+    const btn = document.getElementById('render-toggle-btn');
+    if (btn) btn.innerText = renderState.optOut ? 'Show View' : 'Hide View';
+    ['game-log', 'opponents-container', 'player-area'].forEach(id => {
+        const el = document.getElementById(id);
+        if (el && renderState.optOut) el.classList.add('view-suspended');
+        else if (el) el.classList.remove('view-suspended');
+    });
+
+    if (!renderState.optOut) resumeRendering();
+}
+
+// Game over / replay: restore a hidden view so the board is never left blank
+function clearRenderOptOut() {
+    if (renderState.optOut) toggleRenderSuspend();
+}
+
+// Only watch-only sessions may hide the view; a human with pending decisions must see the board.
+function syncRenderToggle() {
+    const watchOnly = isWatchOnly();
+    if (!watchOnly && renderState.optOut) toggleRenderSuspend();
+
+    const btn = document.getElementById('render-toggle-btn');
+    if (!btn) return;
+    if (watchOnly) btn.classList.remove('hidden');
+    else btn.classList.add('hidden');
+}
+
+function resumeRendering() {
+    if (isRenderSuspended()) return;
+
+    if (renderState.logStale) {
+        renderState.logStale = false;
+        renderState.pendingLog = [];
+        if (typeof renderLogFromState === 'function') renderLogFromState();
+    } else if (renderState.pendingLog.length > 0) {
+        const box = document.getElementById('game-log');
+        if (box) {
+            // Flush the backlog in one batch to avoid a reflow per entry
+            const fragment = document.createDocumentFragment();
+            renderState.pendingLog.forEach(entry => fragment.appendChild(createLogEntry(entry.msg, entry.type)));
+            box.appendChild(fragment);
+            box.scrollTop = box.scrollHeight;
+        }
+        renderState.pendingLog = [];
+    }
+
+    if (renderState.uiDeferred) {
+        renderState.uiDeferred = false;
+        updateUI();
+    }
+}
+
+if (typeof document !== 'undefined' && typeof document.addEventListener === 'function') {
+    document.addEventListener('visibilitychange', () => {
+        if (!document.hidden) resumeRendering();
+    });
+}
+
 // --- UI UPDATER ---
 let uiUpdatePending = false;
 
 function updateUI() {
+    if (isRenderSuspended()) {
+        renderState.uiDeferred = true;
+        return;
+    }
+
     // ⚡ Bolt: Debounce UI updates to prevent layout thrashing and redundant re-renders.
     if (uiUpdatePending) return;
     uiUpdatePending = true;
@@ -188,17 +275,19 @@ function performUpdateUI() {
     }
 }
 
-function log(msg, type='') {
-    gameState.log.push(msg);
+function createLogEntry(msg, type) {
     const div = document.createElement('div');
     div.className = `log-entry ${type}`;
     div.innerText = msg;
-    const box = document.getElementById('game-log');
-    box.appendChild(div);
-    box.scrollTop = box.scrollHeight;
+    return div;
+}
+
+function log(msg, type='') {
+    gameState.log.push(msg);
 
     // Audio Cues based on message content
-    if (window.audio) {
+    // Kept in a background tab (the only sign the game moved on); muted only by Hide View
+    if (window.audio && !renderState.optOut) {
         if (type === 'important' || msg.includes('ELIMINATED')) window.audio.playLose();
         else if (msg.includes('WINS')) window.audio.playWin();
         else if (msg.includes('BLOCKS') || msg.includes('CHALLENGES')) window.audio.playError(); // Alert sound
@@ -208,6 +297,16 @@ function log(msg, type='') {
         }
     }
 
+    // Nobody is watching: queue the entry, skip DOM writes and animations
+    if (isRenderSuspended()) {
+        renderState.pendingLog.push({ msg, type });
+        return;
+    }
+
+    const box = document.getElementById('game-log');
+    box.appendChild(createLogEntry(msg, type));
+    box.scrollTop = box.scrollHeight;
+
     // Red Flash for elimination
     if (msg.includes('ELIMINATED')) {
         triggerAnimation(document.body, 'anim-flash');
@@ -243,14 +342,14 @@ function showNotification(message, type = 'info', callback = null) {
 }
 
 function triggerAnimation(element, animClass) {
-    if (!element) return;
+    if (!element || isRenderSuspended()) return;
     element.classList.remove(animClass);
     void element.offsetWidth; // Trigger reflow
     element.classList.add(animClass);
 }
 
 function spawnFloatingText(text, targetElement) {
-    if (!targetElement) return;
+    if (!targetElement || isRenderSuspended()) return;
     const rect = targetElement.getBoundingClientRect();
 
     const span = document.createElement('span');
@@ -674,6 +773,8 @@ function setupInstallButton() {
 }
 
 function setupGameOverUI(winnerName, isAI) {
+    clearRenderOptOut();
+
     document.getElementById('winner-name').innerText = `${winnerName} WINS!`;
     document.getElementById('game-end-message').innerText = `${isAI ? 'The Bot' : 'The Player'} has won.`;
 
@@ -0,0 +1,133 @@
+const fs = require('fs');
+const vm = require('vm');
+const path = require('path');
+
+// Benchmark: a scripted AI-only log/updateUI stream through the real ui.js,
+// rendered normally vs. with rendering suspended (hidden tab) plus the single
+// catch-up render on resume. Measures JS-side DOM work against a mock DOM;
+// real browsers also pay layout/paint, so savings there are larger.
+
+class MockElement {
+    constructor(tagName = 'div') {
+        this.tagName = tagName.toUpperCase();
+        this.classList = {
+            _classes: new Set(),
+            add: (c) => this.classList._classes.add(c),
+            remove: (c) => this.classList._classes.delete(c),
+            contains: (c) => this.classList._classes.has(c)
+        };
+        this.style = {};
+        this.children = [];
+        this.innerText = '';
+        this.scrollTop = 0;
+        this.scrollHeight = 0;
+        this.offsetWidth = 0;
+    }
+    set innerHTML(v) { this.children = []; }
+    get innerHTML() { return ''; }
+    appendChild(child) {
+        if (child.isFragment) this.children.push(...child.children);
+        else this.children.push(child);
+        this.scrollHeight += 20;
+        return child;
+    }
+    removeChild(child) {}
+    getBoundingClientRect() {
+        return { left: 0, top: 0, width: 10, height: 10 };
+    }
+}
+
+class MockDocument {
+    constructor() {
+        this.elements = {};
+        this.hidden = false;
+        this.body = new MockElement('BODY');
+        this.domOps = 0;
+    }
+    getElementById(id) {
+        this.domOps++;
+        if (!this.elements[id]) this.elements[id] = new MockElement('DIV');
+        return this.elements[id];
+    }
+    querySelector(sel) { return this.getElementById(sel); }
+    createElement(tag) {
+        this.domOps++;
+        return new MockElement(tag);
+    }
+    createDocumentFragment() {
+        const frag = new MockElement('FRAGMENT');
+        frag.isFragment = true;
+        return frag;
+    }
+    addEventListener() {}
+}
+
+function createSandbox() {
+    const doc = new MockDocument();
+    const sandbox = {
+        document: doc,
+        console: console,
+        setTimeout: (fn) => fn(),
+        requestAnimationFrame: (fn) => fn(),
+        isNetworkGame: false,
+        netState: { isHost: false },
+        myPlayerId: 1,
+        crypto: require('crypto').webcrypto
+    };
+    sandbox.window = sandbox;
+    vm.createContext(sandbox);
+    ['utils.js', 'state.js', 'ui.js'].forEach(script => {
+        vm.runInContext(fs.readFileSync(path.join(__dirname, '../js', script), 'utf8'), sandbox);
+    });
+    sandbox.gameState.players = [1, 2, 3, 4, 5, 6].map(id => ({
+        id, name: `Bot ${id}`, coins: 2, isAI: true, alive: true,
+        cards: [{ role: 'Duke', dead: false }, { role: 'Captain', dead: false }]
+    }));
+    return sandbox;
+}
+
+// One AI turn as GameEngine/ActionResolver emit it: several log lines and UI refreshes
+function playScriptedTurns(sandbox, turns) {
+    const players = sandbox.gameState.players;
+    for (let t = 0; t < turns; t++) {
+        const p = players[t % players.length];
+        sandbox.gameState.currentPlayerIndex = t % players.length;
+        p.coins = (p.coins + 1) % 10;
+        sandbox.log(`--- ${p.name}'s Turn ---`);
+        sandbox.updateUI();
+        sandbox.log(`${p.name} attempts to Tax.`);
+        sandbox.updateUI();
+        sandbox.updateUI();
+    }
+}
+
+function run(hidden, turns) {
+    const sandbox = createSandbox();
+    sandbox.document.hidden = hidden;
+    const start = process.hrtime.bigint();
+    playScriptedTurns(sandbox, turns);
+    if (hidden) {
+        sandbox.document.hidden = false;
+        sandbox.resumeRendering(); // Single catch-up render
+    }
+    const ms = Number(process.hrtime.bigint() - start) / 1000000;
+    return { ms, domOps: sandbox.document.domOps, logEntries: sandbox.gameState.log.length };
+}
+
+const turns = 20000;
+console.log(`Running ${turns} scripted AI-only turns (6 bots)...`);
+
+run(false, 500); // Warm up
+run(true, 500);
+
+const visible = run(false, turns);
+const suspended = run(true, turns);
+
+if (visible.logEntries !== suspended.logEntries) {
+    console.error("Game log diverged between runs!");
+    process.exit(1);
+}
+
+console.log(`Rendered:  ${visible.ms.toFixed(2)}ms, ${visible.domOps} DOM calls`);
+console.log(`Suspended: ${suspended.ms.toFixed(2)}ms, ${suspended.domOps} DOM calls (incl. catch-up render)`);
+console.log(`Improvement: ${(visible.ms / suspended.ms).toFixed(1)}x faster, ${(100 * (1 - suspended.domOps / visible.domOps)).toFixed(1)}% fewer DOM calls`);
@@ -0,0 +1,178 @@
+const fs = require('fs');
+const vm = require('vm');
+const path = require('path');
+
+// --- MOCK ENVIRONMENT ---
+
+function createSandbox(withFetch = true) {
+    const sandbox = {
+        console: { log: console.log, error: console.error, warn: () => {} },
+        Math: Math,
+        Uint8Array: Uint8Array,
+        Uint32Array: Uint32Array,
+        DataView: DataView,
+        Promise: Promise,
+        crypto: require('crypto').webcrypto,
+        log: () => {},
+        submitted: [],
+        handleActionSubmit: (action, player, target) => sandbox.submitted.push(action),
+        updateUI: () => {},
+        broadcastState: () => {}
+    };
+    if (withFetch) {
+        // Serve js/policy/*.bin from disk
+        sandbox.fetch = (url) => {
+            const file = path.join(__dirname, '..', url);
+            if (!fs.existsSync(file)) return Promise.resolve({ ok: false });
+            const buf = fs.readFileSync(file);
+            return Promise.resolve({
+                ok: true,
+                arrayBuffer: () => Promise.resolve(buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.byteLength))
+            });
+        };
+    }
+    sandbox.window = sandbox;
+    sandbox.self = sandbox;
+    vm.createContext(sandbox);
+    ['constants.js', 'utils.js', 'policy.js', 'state.js'].forEach(script => {
+        const code = fs.readFileSync(path.join(__dirname, '../js', script), 'utf8');
+        vm.runInContext(code, sandbox);
+    });
+    // Classes and consts are not attached to the global object
+    sandbox.Player = vm.runInContext('Player', sandbox);
+    sandbox.POLICY_KIND = vm.runInContext('POLICY_KIND', sandbox);
+    return sandbox;
+}
+
+function makeCards(roles, deadRoles = []) {
+    return roles.map((role, i) => ({ id: `c${i}`, role, dead: deadRoles.includes(i) }));
+}
+
+// --- TESTS ---
+
+async function runTests() {
+    console.log("=== STARTING POLICY TABLE TESTS ===");
+    let failures = 0;
+
+    // Test 1: Index layout matches tools/train_policy.py
+    try {
+        console.log("\n--- Test 1: Signature index layout ---");
+        const sandbox = createSandbox(false);
+        const { policyIndex, POLICY_KIND } = sandbox;
+        const POLICY_TABLE_SIZE = vm.runInContext('POLICY_TABLE_SIZE', sandbox);
+
+        if (POLICY_TABLE_SIZE !== 4320) throw new Error(`Unexpected table size ${POLICY_TABLE_SIZE}`);
+        if (policyIndex(POLICY_KIND.CHALLENGE, 'Duke', 0, 0, 1, 1, 0, false) !== 0) throw new Error("First index should be 0");
+        // Reference value from policy_index(KIND_BLUFF, 'Contessa', 2, 1, 2, 1, 8, True)
+        if (policyIndex(POLICY_KIND.BLUFF, 'Contessa', 2, 1, 2, 1, 8, true) !== 4217) throw new Error("Index differs from the Python trainer");
+        if (policyIndex(POLICY_KIND.BLUFF, 'Contessa', 3, 2, 2, 2, 7, true) !== POLICY_TABLE_SIZE - 1) throw new Error("Last index out of range");
+        console.log("Passed: Index layout matches trainer.");
+    } catch (e) {
+        console.error("FAILED Test 1:", e);
+        failures++;
+    }
+
+    // Test 2: Lazy loading and header validation
+    try {
+        console.log("\n--- Test 2: Lazy load of shipped tables ---");
+        const sandbox = createSandbox();
+
+        if (sandbox.hasPolicyTable('hard')) throw new Error("Table should not load before a bot needs it");
+        new sandbox.Player(2, 'Bot 1', true, 'hard');
+        const table = await sandbox.loadPolicyTable('hard');
+        if (!table || table.length !== 4320) throw new Error("hard.bin failed to load");
+        if (!sandbox.hasPolicyTable('hard')) throw new Error("Loaded table was not cached");
+        if (await sandbox.loadPolicyTable('broken') !== null) throw new Error("Broken difficulty must not use a table");
+
+        const bad = new Uint8Array(4328);
+        bad.set([67, 80, 79, 76, 2, 0, 0xE0, 0x10]); // 'CPOL', wrong version
+        if (sandbox.parsePolicyTable(bad.buffer) !== null) throw new Error("Unsupported version was accepted");
+
+        for (const d of ['easy', 'normal', 'hardcore']) {
+            if (!await sandbox.loadPolicyTable(d)) throw new Error(`${d}.bin failed to load`);
+        }
+        console.log("Passed: Tables load lazily and validate headers.");
+    } catch (e) {
+        console.error("FAILED Test 2:", e);
+        failures++;
+    }
+
+    // Test 3: Bots consult the table, and fall back to heuristics without one
+    try {
+        console.log("\n--- Test 3: Player decisions use the table ---");
+        const sandbox = createSandbox();
+        await sandbox.loadPolicyTable('hard');
+
+        const bot = new sandbox.Player(2, 'Bot 1', true, 'hard');
+        const liar = new sandbox.Player(1, 'Player 1', false);
+        bot.cards = makeCards(['Duke', 'Duke']);
+        liar.cards = makeCards(['Captain', 'Duke'], [1]);
+        sandbox.gameState.players = [liar, bot];
+
+        // All three Dukes are accounted for: the pinned entry must always challenge
+        if (sandbox.lookupPolicy('hard', sandbox.POLICY_KIND.CHALLENGE, 'Duke', 1, 2, 2, 1, 2, false) !== 1) {
+            throw new Error("Proof entry should be pinned to 1");
+        }
+        for (let i = 0; i < 20; i++) {
+            if (!bot.shouldChallenge({ type: 'Tax', player: liar })) throw new Error("Bot failed to challenge an impossible claim");
+        }
+
+        // Real blockers are still always used
+        bot.cards = makeCards(['Contessa', 'Duke']);
+        if (bot.shouldBlock({ type: 'Assassinate', player: liar, target: bot }) !== 'Contessa') {
+            throw new Error("Bot did not block with its real Contessa");
+        }
+
+        const offline = createSandbox(false);
+        const fallback = new offline.Player(2, 'Bot 1', true, 'hard');
+        if (fallback.usesPolicy()) throw new Error("Bot without a table should use heuristics");
+        console.log("Passed: Table-driven and fallback decisions work.");
+    } catch (e) {
+        console.error("FAILED Test 3:", e);
+        failures++;
+    }
+
+    // Test 4: Each level keeps its own action rule; only the bluff odds come from the table
+    try {
+        console.log("\n--- Test 4: Difficulty action rules are preserved ---");
+        const sandbox = createSandbox();
+        for (const d of ['normal', 'hard']) await sandbox.loadPolicyTable(d);
+        const policyTables = vm.runInContext('policyTables', sandbox);
+        sandbox.sleep = () => Promise.resolve(); // Skip AI thinking time
+
+        const bot = new sandbox.Player(2, 'Bot 1', true, 'normal');
+        const other = new sandbox.Player(1, 'Player 1', false);
+        bot.cards = makeCards(['Contessa', 'Ambassador']);
+        other.cards = makeCards(['Duke', 'Captain']);
+        sandbox.gameState.players = [other, bot];
+
+        // Normal never bluffs an action, table or not
+        for (let i = 0; i < 20; i++) await bot.decideAction();
+        if (sandbox.submitted.some(a => a !== 'Income')) throw new Error(`Normal bot bluffed: ${sandbox.submitted}`);
+
+        // Hard bluffs with the table's odds: a zeroed table means no bluffs
+        policyTables.tables.hard = new Uint8Array(4320);
+        bot.difficulty = 'hard';
+        sandbox.submitted.length = 0;
+        for (let i = 0; i < 20; i++) await bot.decideAction();
+        if (sandbox.submitted.some(a => a !== 'Foreign Aid')) throw new Error(`Hard bot ignored table bluff odds: ${sandbox.submitted}`);
+
+        policyTables.tables.hard.fill(255);
+        sandbox.submitted.length = 0;
+        await bot.decideAction();
+        if (sandbox.submitted[0] !== 'Tax') throw new Error(`Hard bot should bluff Tax, got ${sandbox.submitted[0]}`);
+        console.log("Passed: Action rules kept, bluff odds from the table.");
+    } catch (e) {
+        console.error("FAILED Test 4:", e);
+        failures++;
+    }
+
+    if (failures > 0) {
+        console.error(`\n=== ${failures} TESTS FAILED ===`);
+        process.exit(1);
+    } else {
+        console.log("\n=== ALL POLICY TABLE TESTS PASSED ===");
+    }
+}
+
+runTests();
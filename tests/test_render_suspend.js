@@ -0,0 +1,253 @@
+const fs = require('fs');
+const vm = require('vm');
+const path = require('path');
+
+// --- MOCK DOM & BROWSER API ---
+
+class MockElement {
+    constructor(tagName = 'div') {
+        this.tagName = tagName.toUpperCase();
+        this.classList = {
+            _classes: new Set(),
+            add: (c) => this.classList._classes.add(c),
+            remove: (c) => this.classList._classes.delete(c),
+            toggle: (c) => this.classList._classes.has(c) ? this.classList._classes.delete(c) : this.classList._classes.add(c),
+            contains: (c) => this.classList._classes.has(c),
+            toString: () => Array.from(this.classList._classes).join(' ')
+        };
+        this.id = '';
+        this.innerText = '';
+        this.style = {};
+        this.children = [];
+        this.appendCalls = 0;
+    }
+    appendChild(child) {
+        this.appendCalls++;
+        if (child.isFragment) this.children.push(...child.children);
+        else this.children.push(child);
+        return child;
+    }
+    getBoundingClientRect() {
+        return { left: 0, top: 0, width: 10, height: 10 };
+    }
+}
+
+class MockDocument {
+    constructor() {
+        this.elements = {};
+        this.hidden = false;
+        this.listeners = {};
+        this.body = new MockElement('BODY');
+    }
+    getElementById(id) {
+        if (!this.elements[id]) {
+            this.elements[id] = new MockElement('DIV');
+            this.elements[id].id = id;
+        }
+        return this.elements[id];
+    }
+    createElement(tag) {
+        return new MockElement(tag);
+    }
+    createDocumentFragment() {
+        const frag = new MockElement('FRAGMENT');
+        frag.isFragment = true;
+        return frag;
+    }
+    addEventListener(type, fn) {
+        (this.listeners[type] = this.listeners[type] || []).push(fn);
+    }
+    dispatch(type) {
+        (this.listeners[type] || []).forEach(fn => fn());
+    }
+}
+
+function createSandbox() {
+    const doc = new MockDocument();
+    const sandbox = {
+        document: doc,
+        console: console,
+        setTimeout: (fn) => fn(),
+        requestAnimationFrame: (fn) => fn(),
+        gameState: { players: [], log: [] },
+        isNetworkGame: false,
+        myPlayerId: 1
+    };
+    sandbox.window = sandbox;
+    vm.createContext(sandbox);
+    return sandbox;
+}
+
+function loadUI(sandbox) {
+    const uiCode = fs.readFileSync(path.join(__dirname, '../js/ui.js'), 'utf8');
+    vm.runInContext(uiCode, sandbox);
+
+    // Count renders instead of building the full game board
+    sandbox.renderCount = 0;
+    vm.runInContext('performUpdateUI = function() { renderCount++; };', sandbox);
+}
+
+// --- TESTS ---
+
+function runTests() {
+    console.log("=== STARTING RENDER SUSPEND TESTS ===");
+    let failures = 0;
+
+    // Test 1: Hidden document skips DOM work and coalesces on resume
+    try {
+        console.log("\n--- Test 1: Hidden tab defers rendering ---");
+        const sandbox = createSandbox();
+        loadUI(sandbox);
+        const doc = sandbox.document;
+        const logBox = doc.getElementById('game-log');
+
+        doc.hidden = true;
+        sandbox.log('Bot 1 takes Income.');
+        sandbox.log('Bot 2 is ELIMINATED!', 'important');
+        sandbox.updateUI();
+        sandbox.updateUI();
+        sandbox.spawnFloatingText('+1', doc.getElementById('coins'));
+
+        if (sandbox.gameState.log.length !== 2) throw new Error("gameState.log must still record every entry");
+        if (logBox.children.length !== 0) throw new Error("Log DOM was written while hidden");
+        if (sandbox.renderCount !== 0) throw new Error("UI rendered while hidden");
+        if (doc.body.children.length !== 0) throw new Error("Floating text spawned while hidden");
+
+        doc.hidden = false;
+        doc.dispatch('visibilitychange');
+
+        if (sandbox.renderCount !== 1) throw new Error(`Expected 1 coalesced render, got ${sandbox.renderCount}`);
+        if (logBox.children.length !== 2) throw new Error("Pending log entries were not flushed");
+        if (logBox.appendCalls !== 1) throw new Error("Pending log entries should be flushed in a single append");
+        if (logBox.children[1].className !== 'log-entry important') throw new Error("Log entry type was lost");
+        console.log("Passed: Rendering deferred and coalesced.");
+    } catch (e) {
+        console.error("FAILED Test 1:", e);
+        failures++;
+    }
+
+    // Test 2: Explicit opt-out for watch-only sessions
+    try {
+        console.log("\n--- Test 2: Hide View toggle ---");
+        const sandbox = createSandbox();
+        loadUI(sandbox);
+        const doc = sandbox.document;
+        sandbox.gameState.players = [{ id: 1, isAI: true }, { id: 2, isAI: true }];
+
+        sandbox.syncRenderToggle();
+        if (doc.getElementById('render-toggle-btn').classList.contains('hidden')) {
+            throw new Error("Toggle should be visible in an AI-only game");
+        }
+
+        sandbox.toggleRenderSuspend();
+        sandbox.updateUI();
+        if (sandbox.renderCount !== 0) throw new Error("UI rendered while opted out");
+        if (!doc.getElementById('game-log').classList.contains('view-suspended')) throw new Error("View was not minimised");
+
+        sandbox.toggleRenderSuspend();
+        if (sandbox.renderCount !== 1) throw new Error("Resuming should render once");
+
+        // A human joining the table must never be left with a hidden board
+        sandbox.toggleRenderSuspend();
+        sandbox.gameState.players = [{ id: 1, isAI: false }, { id: 2, isAI: true }];
+        sandbox.syncRenderToggle();
+        if (sandbox.isRenderSuspended()) throw new Error("Opt-out should be cleared when a human is playing");
+        if (!doc.getElementById('render-toggle-btn').classList.contains('hidden')) {
+            throw new Error("Toggle should be hidden when a human is playing");
+        }
+        console.log("Passed: Opt-out suspends and resumes rendering.");
+    } catch (e) {
+        console.error("FAILED Test 2:", e);
+        failures++;
+    }
+
+    // Test 3: Game over and replay clear a Hide View left on from the match
+    try {
+        console.log("\n--- Test 3: Replay after Hide View renders the board ---");
+        const frame = {
+            players: [{ id: 1, name: 'Bot 1', coins: 2, cards: [], isAI: true, alive: true }],
+            currentPlayerIndex: 0,
+            turnPhase: 'ACTION_SELECT',
+            currentAction: null,
+            log: ['Welcome to Coup.', 'Bot 1 WINS THE GAME!']
+        };
+        const history = [{ id: 1, date: '2026-01-01', winner: 'Bot 1', players: ['Bot 1'], log: frame.log, replayData: [frame] }];
+
+        const doc = new MockDocument();
+        const sandbox = {
+            document: doc,
+            console: console,
+            setTimeout: (fn) => fn(),
+            requestAnimationFrame: (fn) => fn(),
+            localStorage: { getItem: () => JSON.stringify(history), setItem: () => {} }
+        };
+        sandbox.window = sandbox;
+        vm.createContext(sandbox);
+        ['utils.js', 'state.js', 'ui.js', 'network.js', 'core/ReplayManager.js'].forEach(script => {
+            vm.runInContext(fs.readFileSync(path.join(__dirname, '../js', script), 'utf8'), sandbox);
+        });
+        sandbox.renderCount = 0;
+        vm.runInContext('performUpdateUI = function() { renderCount++; };', sandbox);
+
+        sandbox.toggleRenderSuspend();
+        if (!sandbox.isRenderSuspended()) throw new Error("Hide View did not suspend rendering");
+
+        sandbox.setupGameOverUI('Bot 1', true);
+        if (sandbox.isRenderSuspended()) throw new Error("Game over should clear Hide View");
+
+        sandbox.toggleRenderSuspend(); // Hidden again before opening the replay
+        sandbox.renderCount = 0;
+        sandbox.loadReplay(0);
+
+        if (sandbox.isRenderSuspended()) throw new Error("Replay should clear Hide View");
+        ['game-log', 'opponents-container', 'player-area'].forEach(id => {
+            if (doc.getElementById(id).classList.contains('view-suspended')) throw new Error(`#${id} is still minimised`);
+        });
+        if (sandbox.renderCount === 0) throw new Error("Replay frame was not rendered");
+        if (doc.getElementById('game-log').children.length !== 2) throw new Error("Replay log was not rendered");
+        console.log("Passed: Game over and replay restore the view.");
+    } catch (e) {
+        console.error("FAILED Test 3:", e);
+        failures++;
+    }
+
+    // Test 4: A hidden tab keeps audio cues for a human seat; Hide View mutes them
+    try {
+        console.log("\n--- Test 4: Audio cues while suspended ---");
+        const sandbox = createSandbox();
+        const played = [];
+        sandbox.audio = {
+            playLose: () => played.push('lose'), playWin: () => played.push('win'),
+            playError: () => played.push('error'), playClick: () => played.push('click')
+        };
+        loadUI(sandbox);
+        const doc = sandbox.document;
+        sandbox.gameState.players = [{ id: 1, isAI: false }, { id: 2, isAI: true }];
+
+        doc.hidden = true;
+        sandbox.log('Bot 1 CHALLENGES Player 1!', 'important');
+        sandbox.log('Bot 1 WINS THE GAME!');
+        if (played.join() !== 'lose,win') throw new Error(`Expected cues in a hidden tab, got [${played}]`);
+        if (doc.getElementById('game-log').children.length !== 0) throw new Error("Log DOM was written while hidden");
+
+        doc.hidden = false;
+        sandbox.gameState.players = [{ id: 1, isAI: true }, { id: 2, isAI: true }];
+        sandbox.toggleRenderSuspend();
+        played.length = 0;
+        sandbox.log('Bot 2 attempts to Tax.');
+        if (played.length !== 0) throw new Error("Hide View should mute audio cues");
+        console.log("Passed: Hidden tab plays cues, Hide View mutes them.");
+    } catch (e) {
+        console.error("FAILED Test 4:", e);
+        failures++;
+    }
+
+    if (failures > 0) {
+        console.error(`\n=== ${failures} TESTS FAILED ===`);
+        process.exit(1);
+    } else {
+        console.log("\n=== ALL RENDER SUSPEND TESTS PASSED ===");
+    }
+}
+
+runTests();
@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+"""Offline trainer for the bots' compact policy tables.
+
+Plays large numbers of self-play Coup games with a rules engine that mirrors
+js/core/ActionResolver.js, fits challenge / block / bluff probabilities keyed
+by a compact public-state signature, and writes one binary table per
+difficulty to js/policy/<difficulty>.bin. Those files are loaded lazily by
+js/policy.js and looked up in constant time per decision.
+
+The signature layout MUST stay in sync with policyIndex() in js/policy.js:
+
+    kind (3) x role (5) x revealed (4) x held (3) x myAlive (2)
+             x oppAlive (2) x coinBucket (3) x repeat (2)
+
+Table file format: b'CPOL', u8 version, u8 reserved, u16 LE entry count,
+followed by one u8 per entry (probability * 255).
+
+Usage:
+    python3 tools/train_policy.py                  # train + write tables + report
+    python3 tools/train_policy.py --games 2000 --generations 2 --eval-games 1000
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import struct
+import sys
+
+ROLES = ['Duke', 'Assassin', 'Captain', 'Ambassador', 'Contessa']
+ACTIONS = {
+    'Income': {'cost': 0, 'blockable': False, 'challengeable': False},
+    'Foreign Aid': {'cost': 0, 'blockable': True, 'challengeable': False, 'blockedBy': ['Duke']},
+    'Coup': {'cost': 7, 'blockable': False, 'challengeable': False},
+    'Tax': {'cost': 0, 'blockable': False, 'challengeable': True, 'role': 'Duke'},
+    'Assassinate': {'cost': 3, 'blockable': True, 'challengeable': True, 'role': 'Assassin', 'blockedBy': ['Contessa']},
+    'Steal': {'cost': 0, 'blockable': True, 'challengeable': True, 'role': 'Captain', 'blockedBy': ['Captain', 'Ambassador']},
+    'Exchange': {'cost': 0, 'blockable': False, 'challengeable': True, 'role': 'Ambassador'},
+}
+DIFFICULTIES = ['easy', 'normal', 'hard', 'hardcore']
+
+# --- POLICY SIGNATURE (mirror of js/policy.js) ---
+
+KIND_CHALLENGE = 0
+KIND_BLOCK = 1
+KIND_BLUFF = 2
+TABLE_SIZE = 3 * 5 * 4 * 3 * 2 * 2 * 3 * 2
+TABLE_MAGIC = b'CPOL'
+TABLE_VERSION = 1
+
+# Untrained starting point; weaker variants are blended back towards it.
+PRIOR = {KIND_CHALLENGE: 0.2, KIND_BLOCK: 0.3, KIND_BLUFF: 0.3}
+
+
+def coin_bucket(coins):
+    if coins >= 7:
+        return 2
+    if coins >= 3:
+        return 1
+    return 0
+
+
+def policy_index(kind, role, revealed, held, my_alive, opp_alive, coins, repeat):
+    idx = kind
+    idx = idx * 5 + ROLES.index(role)
+    idx = idx * 4 + min(revealed, 3)
+    idx = idx * 3 + min(held, 2)
+    idx = idx * 2 + (1 if my_alive >= 2 else 0)
+    idx = idx * 2 + (1 if opp_alive >= 2 else 0)
+    idx = idx * 3 + coin_bucket(coins)
+    idx = idx * 2 + (1 if repeat else 0)
+    return idx
+
+
+def decode_index(idx):
+    idx, repeat = divmod(idx, 2)
+    idx, coins = divmod(idx, 3)
+    idx, opp_alive = divmod(idx, 2)
+    idx, my_alive = divmod(idx, 2)
+    idx, held = divmod(idx, 3)
+    idx, revealed = divmod(idx, 4)
+    kind, role = divmod(idx, 5)
+    return kind, role, revealed, held, my_alive, opp_alive, coins, repeat
+
+
+def initial_table():
+    return [PRIOR[decode_index(i)[0]] for i in range(TABLE_SIZE)]
+
+
+def write_table(path, probs):
+    data = bytes(max(0, min(255, int(round(p * 255)))) for p in probs)
+    with open(path, 'wb') as f:
+        f.write(TABLE_MAGIC + struct.pack('<BBH', TABLE_VERSION, 0, len(data)) + data)
+
+
+def read_table(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if raw[:4] != TABLE_MAGIC:
+        raise ValueError(f'{path}: not a policy table')
+    version, _, count = struct.unpack('<BBH', raw[4:8])
+    if version != TABLE_VERSION or count != TABLE_SIZE:
+        raise ValueError(f'{path}: unsupported table (version {version}, {count} entries)')
+    return [b / 255 for b in raw[8:8 + count]]
+
+
+# --- GAME MODEL (mirror of js/core/ActionResolver.js) ---
+
+class Card:
+    __slots__ = ('role', 'dead')
+
+    def __init__(self, role):
+        self.role = role
+        self.dead = False
+
+
+class Player:
+    def __init__(self, pid, bot):
+        self.id = pid
+        self.bot = bot
+        self.coins = 2
+        self.cards = []
+        self.alive = True
+        self.last_action = None
+        self.prev_action = None
+
+    def alive_count(self):
+        return sum(1 for c in self.cards if not c.dead)
+
+    def held(self, role):
+        return sum(1 for c in self.cards if c.role == role and not c.dead)
+
+    def has_role(self, role):
+        return self.held(role) > 0
+
+
+class Game:
+    def __init__(self, bots, rng):
+        self.rng = rng
+        self.deck = [Card(r) for r in ROLES for _ in range(3)]
+        rng.shuffle(self.deck)
+        self.players = [Player(i, bot) for i, bot in enumerate(bots)]
+        for p in self.players:
+            p.cards = [self.deck.pop(), self.deck.pop()]
+        self.current = rng.randrange(len(self.players))
+        self.action = None
+
+    def revealed(self, role):
+        return sum(1 for p in self.players for c in p.cards if c.dead and c.role == role)
+
+    def opponents(self, me):
+        return [p for p in self.players if p.id != me.id and p.alive]
+
+    def strongest_opponent(self, me):
+        # getStrongestOpponent(): most live cards, then most coins
+        target, max_cards, max_coins = None, -1, -1
+        for p in self.opponents(me):
+            n = p.alive_count()
+            if n > max_cards or (n == max_cards and p.coins > max_coins):
+                target, max_cards, max_coins = p, n, p.coins
+        return target
+
+    def run(self, max_turns=400):
+        for _ in range(max_turns):
+            alive = [p for p in self.players if p.alive]
+            if len(alive) == 1:
+                return alive[0]
+            p = self.players[self.current]
+            if p.alive:
+                self.play_turn(p)
+            self.current = (self.current + 1) % len(self.players)
+        return None
+
+    def play_turn(self, p):
+        if p.coins >= 10:
+            action = 'Coup'
+        else:
+            action = p.bot.choose_action(self, p)
+        target = None
+        if action in ('Assassinate', 'Steal', 'Coup'):
+            target = self.strongest_opponent(p)
+            if target is None:
+                action = 'Income'
+        if ACTIONS[action]['cost'] > p.coins:
+            action, target = 'Income', None
+
+        # handleActionSubmit()
+        p.prev_action = p.last_action
+        p.last_action = action
+        p.coins -= ACTIONS[action]['cost']
+        self.action = {'type': action, 'player': p, 'target': target}
+        self.process_reactions(self.action)
+
+    def process_reactions(self, act):
+        actor = act['player']
+        spec = ACTIONS[act['type']]
+
+        if spec['challengeable']:
+            for p in self.players:
+                if p.id == actor.id or not p.alive:
+                    continue
+                if p.bot.should_challenge(self, p, act):
+                    if self.resolve_challenge(actor, p, spec['role']):
+                        self.resolve_effect(act)
+                    return
+
+        if spec['blockable']:
+            if act['type'] == 'Foreign Aid':
+                blockers = self.opponents(actor)
+            else:
+                blockers = [act['target']] if act['target'] else []
+            for p in blockers:
+                role = p.bot.should_block(self, p, act)
+                if not role:
+                    continue
+                if role not in spec['blockedBy']:
+                    role = spec['blockedBy'][0]
+                block = {'type': 'Block', 'player': p, 'role': role}
+                for c in self.players:
+                    if c.id == p.id or not c.alive:
+                        continue
+                    if c.bot.should_challenge(self, c, block):
+                        if not self.resolve_challenge(p, c, role):
+                            self.resolve_effect(act)
+                        return
+                return
+
+        self.resolve_effect(act)
+
+    def resolve_challenge(self, claimant, challenger, role):
+        if claimant.has_role(role):
+            self.lose_influence(challenger)
+            idx = next(i for i, c in enumerate(claimant.cards) if c.role == role and not c.dead)
+            self.deck.append(claimant.cards[idx])
+            self.rng.shuffle(self.deck)
+            claimant.cards[idx] = self.deck.pop()
+            return True
+        if self.action['player'] is claimant and self.action['type'] == 'Assassinate':
+            claimant.coins += 3
+        self.lose_influence(claimant)
+        return False
+
+    def lose_influence(self, p):
+        if not p.alive:
+            return
+        live = [c for c in p.cards if not c.dead]
+        if not live:
+            return
+        self.rng.choice(live).dead = True
+        if all(c.dead for c in p.cards):
+            p.alive = False
+
+    def resolve_effect(self, act):
+        p, t = act['player'], act['target']
+        kind = act['type']
+        if kind == 'Income':
+            p.coins += 1
+        elif kind == 'Foreign Aid':
+            p.coins += 2
+        elif kind == 'Tax':
+            p.coins += 3
+        elif kind == 'Steal' and t:
+            stolen = min(t.coins, 2)
+            t.coins -= stolen
+            p.coins += stolen
+        elif kind in ('Assassinate', 'Coup') and t:
+            self.lose_influence(t)
+        elif kind == 'Exchange':
+            drawn = [self.deck.pop() for _ in range(min(2, len(self.deck)))]
+            live = [c for c in p.cards if not c.dead]
+            dead = [c for c in p.cards if c.dead]
+            pool = live + drawn
+            self.rng.shuffle(pool)
+            keep = max(len(live), 1)
+            self.deck.extend(pool[keep:])
+            self.rng.shuffle(self.deck)
+            p.cards = pool[:keep] + dead
+
+
+# --- SIGNATURES ---
+
+def challenge_key(game, me, act):
+    claimant = act['player']
+    role = act.get('role') or ACTIONS[act['type']]['role']
+    repeat = act['type'] != 'Block' and claimant.prev_action == act['type']
+    return policy_index(KIND_CHALLENGE, role, game.revealed(role), me.held(role), me.alive_count(),
+                        claimant.alive_count(), me.coins, repeat)
+
+
+def block_key(game, me, act, role):
+    actor = act['player']
+    return policy_index(KIND_BLOCK, role, game.revealed(role), 0, me.alive_count(),
+                        actor.alive_count(), me.coins, actor.prev_action == act['type'])
+
+
+def bluff_key(game, me, action):
+    role = ACTIONS[action]['role']
+    opp = game.strongest_opponent(me)
+    return policy_index(KIND_BLUFF, role, game.revealed(role), 0, me.alive_count(),
+                        opp.alive_count() if opp else 1, me.coins, me.last_action == action)
+
+
+# --- BOTS ---
+
+class HeuristicBot:
+    """Port of the hand-tuned Player logic in js/state.js (non-broken levels).
+
+    With ``record`` set, every challenge / bluff-block / bluff-claim decision is
+    appended to ``trace`` as (signature, choice) so the heuristic can be fitted
+    into a table.
+    """
+
+    def __init__(self, difficulty, rng, record=False):
+        self.difficulty = difficulty
+        self.rng = rng
+        self.record = record
+        self.trace = []
+
+    def bluff(self, game, me, action, threshold):
+        choice = self.rng.random() > threshold
+        if self.record:
+            self.trace.append((bluff_key(game, me, action), choice))
+        return choice
+
+    def choose_action(self, game, me):
+        d = self.difficulty
+        can_assassinate = me.coins >= 3
+        has_duke, has_assassin, has_captain = me.has_role('Duke'), me.has_role('Assassin'), me.has_role('Captain')
+
+        if d == 'hardcore':
+            if me.coins >= 7:
+                return 'Coup'
+            if can_assassinate and (has_assassin or self.bluff(game, me, 'Assassinate', 0.3)):
+                return 'Assassinate'
+            if has_duke or self.bluff(game, me, 'Tax', 0.4):
+                return 'Tax'
+            if has_captain or self.bluff(game, me, 'Steal', 0.5):
+                return 'Steal'
+            return 'Foreign Aid'
+        if d == 'hard':
+            if me.coins >= 7:
+                return 'Coup'
+            if can_assassinate and (has_assassin or self.bluff(game, me, 'Assassinate', 0.4)):
+                return 'Assassinate'
+            if has_duke or self.bluff(game, me, 'Tax', 0.3):
+                return 'Tax'
+            if has_captain or self.bluff(game, me, 'Steal', 0.5):
+                return 'Steal'
+            return 'Foreign Aid'
+        if d == 'normal':
+            if me.coins >= 7:
+                return 'Coup'
+            if has_duke:
+                return 'Tax'
+            if can_assassinate and has_assassin:
+                return 'Assassinate'
+            if has_captain:
+                return 'Steal'
+            return 'Income'
+        opts = ['Income', 'Foreign Aid', 'Tax']
+        if me.coins >= 3:
+            opts.append('Assassinate')
+        return self.rng.choice(opts)
+
+    def should_challenge(self, game, me, act):
+        bluffer = act['player']
+        if not me.alive or me.id == bluffer.id:
+            return False
+        if act['type'] != 'Block' and not ACTIONS[act['type']]['challengeable']:
+            return False
+        choice = self.heuristic_challenge(game, me, act)
+        if self.record:
+            self.trace.append((challenge_key(game, me, act), choice))
+        return choice
+
+    def heuristic_challenge(self, game, me, act):
+        bluffer = act['player']
+        d = self.difficulty
+        r = self.rng.random
+
+        threshold = {'hard': 0.6, 'hardcore': 0.4}.get(d, 0.8)
+        if bluffer.last_action == act['type'] and act['type'] in ACTIONS and ACTIONS[act['type']].get('role'):
+            threshold -= 0.2
+            if act['type'] == 'Exchange':
+                threshold -= 0.1
+
+        claimed = act.get('role') or ACTIONS.get(act['type'], {}).get('role')
+        if claimed:
+            mine = me.held(claimed)
+            known = mine + game.revealed(claimed)
+            if d in ('hard', 'hardcore') and known == 3:
+                return True
+            if d == 'hardcore' and (known == 2 or mine == 2):
+                return True
+            if d == 'hard' and mine == 2:
+                return True
+            if claimed == 'Ambassador':
+                if mine == 2:
+                    return True
+                if mine == 1 and r() > 0.7 and d != 'easy':
+                    return True
+
+        if act['type'] == 'Tax':
+            dukes = me.held('Duke')
+            if dukes == 2:
+                return True
+            if d in ('hard', 'hardcore') and dukes == 1 and r() > 0.5:
+                return True
+
+        return r() > threshold
+
+    def should_block(self, game, me, act):
+        if not me.alive or me.id == act['player'].id:
+            return False
+        spec = ACTIONS[act['type']]
+        if not spec['blockable']:
+            return False
+        if act['target'] and act['target'].id != me.id and act['type'] != 'Foreign Aid':
+            return False
+        for c in me.cards:
+            if not c.dead and c.role in spec['blockedBy']:
+                return c.role
+
+        d = self.difficulty
+        r = self.rng.random
+        bluff = False
+        if d == 'hardcore':
+            if act['type'] == 'Assassinate':
+                bluff = True
+            if act['type'] == 'Steal' and r() > 0.3:
+                bluff = True
+            if act['type'] == 'Foreign Aid' and r() > 0.5:
+                bluff = True
+        if d == 'hard' and act['type'] == 'Assassinate' and r() > 0.2:
+            bluff = True
+        if d == 'hard' and act['type'] == 'Steal' and r() > 0.5:
+            bluff = True
+        if self.record:
+            for role in spec['blockedBy']:
+                self.trace.append((block_key(game, me, act, role), bluff))
+        if bluff:
+            return self.rng.choice(spec['blockedBy'])
+        return False
+
+
+class TableBot(HeuristicBot):
+    """Table-driven bot; mirrors the policy branches of Player in js/state.js.
+
+    The action rule of its difficulty is kept; only the bluff-claim, challenge
+    and bluff-block probabilities come from the table. When ``explore`` > 0 a
+    share of decisions is taken uniformly at random and every decision is
+    recorded in ``trace`` for credit assignment.
+    """
+
+    def __init__(self, difficulty, table, rng, explore=0.0):
+        super().__init__(difficulty, rng)
+        self.table = table
+        self.explore = explore
+
+    def decide(self, idx):
+        if self.explore and self.rng.random() < self.explore:
+            choice = self.rng.random() < 0.5
+        else:
+            choice = self.rng.random() < self.table[idx]
+        if self.explore:
+            self.trace.append((idx, choice))
+        return choice
+
+    def bluff(self, game, me, action, threshold):
+        return self.decide(bluff_key(game, me, action))
+
+    def should_challenge(self, game, me, act):
+        if not me.alive or me.id == act['player'].id:
+            return False
+        if act['type'] != 'Block' and not ACTIONS[act['type']]['challengeable']:
+            return False
+        return self.decide(challenge_key(game, me, act))
+
+    def should_block(self, game, me, act):
+        if not me.alive or me.id == act['player'].id:
+            return False
+        spec = ACTIONS[act['type']]
+        if not spec['blockable']:
+            return False
+        if act['target'] and act['target'].id != me.id and act['type'] != 'Foreign Aid':
+            return False
+        for c in me.cards:
+            if not c.dead and c.role in spec['blockedBy']:
+                return c.role
+
+        best_idx, best_role = None, None
+        for role in spec['blockedBy']:
+            idx = block_key(game, me, act, role)
+            if best_idx is None or self.table[idx] > self.table[best_idx]:
+                best_idx, best_role = idx, role
+        return best_role if self.decide(best_idx) else False
+
+
+# --- TRAINING ---
+
+def tally(trace, won, yes_n, yes_w, no_n, no_w):
+    for idx, choice in trace:
+        if choice:
+            yes_n[idx] += 1
+            yes_w[idx] += won
+        else:
+            no_n[idx] += 1
+            no_w[idx] += won
+
+
+def fit_heuristic(difficulty, games, rng):
+    """Table reproducing the average decisions of one heuristic level.
+
+    Signatures the heuristic never visits fall back to the per-kind mean.
+    """
+    yes_n = [0] * TABLE_SIZE
+    no_n = [0] * TABLE_SIZE
+    for _ in range(games):
+        bots = [HeuristicBot(difficulty, rng, record=True) for _ in range(rng.randint(2, 5))]
+        Game(bots, rng).run()
+        for bot in bots:
+            for idx, choice in bot.trace:
+                if choice:
+                    yes_n[idx] += 1
+                else:
+                    no_n[idx] += 1
+
+    totals = {kind: [0, 0] for kind in PRIOR}
+    for idx in range(TABLE_SIZE):
+        kind = decode_index(idx)[0]
+        totals[kind][0] += yes_n[idx]
+        totals[kind][1] += yes_n[idx] + no_n[idx]
+    means = {kind: (y / n if n else 0.0) for kind, (y, n) in totals.items()}
+
+    return [yes_n[i] / (yes_n[i] + no_n[i]) if yes_n[i] + no_n[i] else means[decode_index(i)[0]]
+            for i in range(TABLE_SIZE)]
+
+
+def train(table, games, generations, explore, rng, log=print):
+    """Monte Carlo policy improvement over self-play.
+
+    For every visited signature the win rate after answering "yes" is compared
+    with the win rate after "no"; the table is nudged towards a sigmoid of that
+    advantage each generation. Learners play with the action rules of the
+    bluffing levels so bluff-claim signatures get visited.
+    """
+    for gen in range(1, generations + 1):
+        yes_n = [0] * TABLE_SIZE
+        yes_w = [0] * TABLE_SIZE
+        no_n = [0] * TABLE_SIZE
+        no_w = [0] * TABLE_SIZE
+
+        for _ in range(games):
+            bots = []
+            for _ in range(rng.randint(2, 5)):
+                if rng.random() < 0.5:
+                    bots.append(TableBot(rng.choice(DIFFICULTIES[1:]), table, rng, explore))
+                else:
+                    bots.append(HeuristicBot(rng.choice(DIFFICULTIES[1:]), rng))
+            winner = Game(bots, rng).run()
+            for bot in bots:
+                if isinstance(bot, TableBot):
+                    won = 1 if winner is not None and winner.bot is bot else 0
+                    tally(bot.trace, won, yes_n, yes_w, no_n, no_w)
+
+        updated = 0
+        for idx in range(TABLE_SIZE):
+            if yes_n[idx] < 20 or no_n[idx] < 20:
+                continue
+            adv = (yes_w[idx] + 1) / (yes_n[idx] + 2) - (no_w[idx] + 1) / (no_n[idx] + 2)
+            target = 1 / (1 + math.exp(-adv * 25))
+            table[idx] += 0.5 * (target - table[idx])
+            updated += 1
+        log(f'generation {gen}/{generations}: {games} games, {updated} signatures updated')
+    return table
+
+
+# Share of the trained table blended into each level's fitted heuristic table.
+# Easy stays close to the old Easy; strength rises with the level (Hardcore is
+# additionally sharpened towards the learned majority decision).
+VARIANT_WEIGHT = {'easy': 0.15, 'normal': 0.3, 'hard': 1.0, 'hardcore': 1.0}
+
+
+def make_variant(trained, fitted, difficulty):
+    """Derive a difficulty variant from the trained and fitted tables."""
+    w = VARIANT_WEIGHT[difficulty]
+    out = []
+    for idx, (p, h) in enumerate(zip(trained, fitted)):
+        kind, _, revealed, held = decode_index(idx)[:4]
+        p = w * p + (1 - w) * h
+        if difficulty == 'hardcore':
+            p = min(max(p, 1e-3), 1 - 1e-3)
+            p = 1 / (1 + math.exp(-2 * math.log(p / (1 - p))))
+        # Every copy of the claimed role is accounted for: a certain bluff.
+        if kind == KIND_CHALLENGE and revealed + held >= 3 and difficulty in ('hard', 'hardcore'):
+            p = 1.0
+        out.append(p)
+    return out
+
+
+# --- REPORT ---
+
+def win_rate(make_seat0, opponent, games, rng):
+    """Share of games won by seat 0 against heuristic opponents of one difficulty."""
+    wins = expected = 0.0
+    for _ in range(games):
+        n = rng.randint(2, 5)
+        expected += 1 / n
+        bots = [make_seat0()] + [HeuristicBot(opponent, rng) for _ in range(n - 1)]
+        winner = Game(bots, rng).run()
+        wins += 1 if winner is not None and winner.bot is bots[0] else 0
+    return wins / games, expected / games
+
+
+def evaluate(table, difficulty, games, rng):
+    """Compare a table variant with the heuristic bot it replaces.
+
+    Both bots use the same action rule, so the difference is the table's own
+    effect on bluff, challenge and block decisions.
+    """
+    table_same, fair = win_rate(lambda: TableBot(difficulty, table, rng), difficulty, games, rng)
+    table_hard, _ = win_rate(lambda: TableBot(difficulty, table, rng), 'hard', games, rng)
+    heuristic_same, _ = win_rate(lambda: HeuristicBot(difficulty, rng), difficulty, games, rng)
+    heuristic_hard, _ = win_rate(lambda: HeuristicBot(difficulty, rng), 'hard', games, rng)
+    return {
+        'difficulty': difficulty,
+        'games': games,
+        'table_vs_same': table_same,
+        'heuristic_vs_same': heuristic_same,
+        'table_vs_hard': table_hard,
+        'heuristic_vs_hard': heuristic_hard,
+        'fair_share': fair,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser.add_argument('--games', type=int, default=20000, help='self-play games per generation')
+    parser.add_argument('--generations', type=int, default=6)
+    parser.add_argument('--explore', type=float, default=0.3, help='share of random decisions while training')
+    parser.add_argument('--fit-games', type=int, default=10000, help='games per level to fit the heuristic tables')
+    parser.add_argument('--eval-games', type=int, default=3000, help='games per difficulty for the win-rate report')
+    parser.add_argument('--seed', type=int, default=2026)
+    parser.add_argument('--out', default=os.path.join(root, 'js', 'policy'), help='output directory for .bin tables')
+    parser.add_argument('--report', help='optional path for a JSON win-rate report')
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    fitted = {d: fit_heuristic(d, args.fit_games, rng) for d in DIFFICULTIES}
+    trained = train(list(fitted['hard']), args.games, args.generations, args.explore, rng)
+
+    os.makedirs(args.out, exist_ok=True)
+    results = []
+    print('\nWin rate of one bot vs. heuristic opponents (same level / hard), same action rule:')
+    print(f'{"difficulty":<10} {"table":>15} {"heuristic":>15} {"fair":>7}')
+    for difficulty in DIFFICULTIES:
+        variant = make_variant(trained, fitted[difficulty], difficulty)
+        path = os.path.join(args.out, f'{difficulty}.bin')
+        write_table(path, variant)
+        # Evaluate exactly what ships (quantised to u8)
+        res = evaluate(read_table(path), difficulty, args.eval_games, rng)
+        results.append(res)
+        table = f'{res["table_vs_same"]:.1%} / {res["table_vs_hard"]:.1%}'
+        heuristic = f'{res["heuristic_vs_same"]:.1%} / {res["heuristic_vs_hard"]:.1%}'
+        print(f'{difficulty:<10} {table:>15} {heuristic:>15} {res["fair_share"]:>7.1%}')
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())